@@ -2,6 +2,7 @@ import asyncio
 import datetime
 from functools import wraps
 import logging
+import struct
 from typing import Literal
 
 from bleak import BleakScanner, BleakError
@@ -43,6 +44,9 @@ class BLEScanner:
     LINE_HEIGHT = 5
     SENT_THRESHOLD_TEMP = 1
     ATC_SERVICE = "0000181a-0000-1000-8000-00805f9b34fb"
+    # temp, humidity, battery_v, battery, count at offset 6 of the ATC payload
+    ATC_STRUCT = struct.Struct("<hhHBB")
+    ATC_PAYLOAD_SIZE = 6 + ATC_STRUCT.size
 
     def __init__(
         self,
@@ -54,6 +58,7 @@ class BLEScanner:
         use_text_pos: bool = True,
         sent_theshold_temp: float = SENT_THRESHOLD_TEMP,
         mode: str = "auto",  # all, passive, active
+        service_filter: bool = False,
     ):
         self.output = output or ConsolePrint()
         self.stop_event = asyncio.Event()
@@ -61,7 +66,9 @@ class BLEScanner:
         self.atc_date = {}
         self.atc_custom_names = custom_names or {}
         self.atc_devices = {}
-        self.print_pos = {"x": 0, "y": 0}
+        self.default_names = {}
+        self.pos_x = 0
+        self.pos_y = 0
         self.alert_low_threshold = alert_low_threshold
         self.alert_high_threshold = alert_high_threshold
         self.notification = notification
@@ -69,23 +76,24 @@ class BLEScanner:
         self.cache_sent_alert = {}
         self.sent_threshold_temp = sent_theshold_temp
         self.mode = mode
+        self.service_filter = service_filter
         assert self.output is not None, "Output is not set"
 
     def set_text_pos(self, x: int = None, y: int = None) -> None:
         """Set the print cursor position."""
         if x is not None:
-            self.print_pos["x"] = x
+            self.pos_x = x
         if y is not None:
-            self.print_pos["y"] = y
+            self.pos_y = y
 
     def shift_text_pos(self, dx: int = None, dy: int = None) -> None:
         if dx:
-            self.print_pos["x"] += dx
+            self.pos_x += dx
         if dy:
-            self.print_pos["y"] += dy
+            self.pos_y += dy
 
     def get_text_pos_dict(self) -> dict:
-        return self.print_pos.copy()
+        return {"x": self.pos_x, "y": self.pos_y}
 
     async def print_text(self, text: str, max_width: int = None) -> None:
         """Print text at the current cursor position."""
@@ -94,6 +102,15 @@ class BLEScanner:
         if self.use_text_pos:
             self.shift_text_pos(dy=1)
 
+    async def print_lines(self, lines: list[str], max_width: int = None) -> None:
+        """Print several lines at the current cursor position at once."""
+        pos = self.get_text_pos_dict() if self.use_text_pos else None
+        await self.output.print_lines(
+            [self.align_line_width(line, max_width) for line in lines], pos=pos
+        )
+        if self.use_text_pos:
+            self.shift_text_pos(dy=len(lines))
+
     async def print_clear(self) -> None:
         """Clear the terminal screen."""
         if self.use_text_pos:
@@ -110,7 +127,11 @@ class BLEScanner:
     async def process_advertising_data(self, device, advertising_data):
         """Process BLE advertising data."""
         adv_atc = advertising_data.service_data.get(self.ATC_SERVICE)
-        if not adv_atc:
+        # Skip other formats of the same service, e.g. ATC1441 or encrypted ones
+        if not adv_atc or len(adv_atc) < self.ATC_PAYLOAD_SIZE:
+            return
+        # BLE repeats the same advertisement on every channel, skip the duplicates
+        if self.atc_counters.get(device.address) == adv_atc[13]:
             return
 
         name = self.custom_name(device.name) or self.generate_device_name(device)
@@ -131,11 +152,16 @@ class BLEScanner:
 
     def generate_device_name(self, device):
         """Generate a default name if none is provided."""
-        if ":" in device.address:
-            uiid = "".join(device.address.split(":")[-3:])
-        else:
-            uiid = device.address.split("-")[-1][-6:]
-        return self.custom_name("ATC_" + uiid)
+        name = self.default_names.get(device.address)
+        if name is None:
+            address = device.address
+            if ":" in address:
+                # AA:BB:CC:DD:EE:FF
+                uiid = address[9:11] + address[12:14] + address[15:17]
+            else:
+                uiid = address[-6:]
+            name = self.default_names[address] = "ATC_" + uiid
+        return self.custom_name(name)
 
     def get_device_name(self, address: str) -> str | None:
         """Get the name of a registered BLE device."""
@@ -144,10 +170,9 @@ class BLEScanner:
 
     async def update_device_data(self, device, advertising_data, adv_atc):
         """Update the data of a registered BLE device."""
-        count = int.from_bytes(adv_atc[13:14], byteorder="little", signed=False)
-        if self.atc_counters.get(device.address) == count:
-            return
-
+        temp, humidity, battery_v, battery, count = self.ATC_STRUCT.unpack_from(
+            adv_atc, 6
+        )
         self.atc_counters[device.address] = count
         date_now = datetime.datetime.now()
         date_diff: datetime.timedelta = date_now - self.atc_date.get(
@@ -155,14 +180,9 @@ class BLEScanner:
         )
         self.atc_date[device.address] = date_now
 
-        temp = int.from_bytes(adv_atc[6:8], byteorder="little", signed=True) / 100.0
-        humidity = (
-            int.from_bytes(adv_atc[8:10], byteorder="little", signed=True) / 100.0
-        )
-        battery_v = (
-            int.from_bytes(adv_atc[10:12], byteorder="little", signed=False) / 1000.0
-        )
-        battery = int.from_bytes(adv_atc[12:13], byteorder="little", signed=False)
+        temp /= 100.0
+        humidity /= 100.0
+        battery_v /= 1000.0
         rssi = advertising_data.rssi
 
         await self.display_device_info(
@@ -202,17 +222,20 @@ class BLEScanner:
     ):
         """Display formatted device information."""
         name = self.get_device_name(address)
+        lines = [
+            f"Device: {name}",
+            "-" * self.WINDOW_WIDTH,
+            f"Temp: {temp:<.2f}°C",
+            f"Humidity: {humidity:<.2f}%",
+            f"Battery: {battery}% ({battery_v:.2f}V)",
+            f"RSSI: {rssi} dBm",
+            f"Count: {count:<3}",
+            f"Last Seen: {date_now.strftime('%H:%M:%S'):<8}",
+        ]
+        if date_diff:
+            lines.append(f"Duration: {str(date_diff).split('.')[0]:<9}")
         async with self.output.lock:
-            await self.print_text(f"Device: {name}")
-            await self.print_text("-" * self.WINDOW_WIDTH)
-            await self.print_text(f"Temp: {temp:<.2f}°C")
-            await self.print_text(f"Humidity: {humidity:<.2f}%")
-            await self.print_text(f"Battery: {battery}% ({battery_v:.2f}V)")
-            await self.print_text(f"RSSI: {rssi} dBm")
-            await self.print_text(f"Count: {count:<3}")
-            await self.print_text(f"Last Seen: {date_now.strftime('%H:%M:%S'):<8}")
-            if date_diff:
-                await self.print_text(f"Duration: {str(date_diff).split('.')[0]:<9}")
+            await self.print_lines(lines)
 
     @staticmethod
     def generate_title_message(
@@ -294,13 +317,17 @@ class BLEScanner:
         # self.print_clear()
         modes = ("passive", "active") if self.mode.lower() == "auto" else (self.mode,)
         mode: Literal["active", "passive"]
+        # Let the platform scanner drop advertisements of other devices
+        service_uuids = [self.ATC_SERVICE] if self.service_filter else None
         for mode in modes:
             logger.info(f"Scanning BLE devices in {mode} mode...")
             try:
                 if mode not in ["active", "passive"]:
                     raise ValueError("Mode must be either 'active' or 'passive'.")
                 async with BleakScanner(
-                    self.process_advertising_data, scanning_mode=mode
+                    self.process_advertising_data,
+                    scanning_mode=mode,
+                    service_uuids=service_uuids,
                 ):
                     await self.stop_event.wait()
                     break
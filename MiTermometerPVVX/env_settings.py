@@ -62,6 +62,9 @@ class Settings:
         self.BLE_SCANNER_MODE = os.getenv("BLE_SCANNER_MODE", "auto").lower()
         if self.BLE_SCANNER_MODE not in ["auto", "passive", "active"]:
             self.BLE_SCANNER_MODE = "auto"
+        self.BLE_SERVICE_FILTER = (
+            os.getenv("BLE_SERVICE_FILTER", "False").strip().lower() == "true"
+        )
 
         self.BASE_PATH = Path(__file__).parent
         self.APP_NAME = "BLE metrics and notification"
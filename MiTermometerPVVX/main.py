@@ -3,6 +3,11 @@ import logging
 from logging.handlers import QueueHandler, QueueListener
 from queue import Queue
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from env_settings import settings
 from outputs import ConsolePrintAsync
 from parse_args import parse_args
@@ -95,6 +100,7 @@ async def main(
     use_text_pos: bool = False,
     sent_threshold_temp: float = None,
     mode: str = None,
+    service_filter: bool = False,
     notification: ManagerNotifications = None,
     debug: bool = False,
 ):
@@ -113,6 +119,7 @@ async def main(
         use_text_pos=use_text_pos,
         sent_theshold_temp=sent_threshold_temp,
         mode=mode,
+        service_filter=service_filter,
     )
     params = []
     if custom_names:
@@ -125,6 +132,7 @@ async def main(
         params.append(f"sent_threshold_temp={sent_threshold_temp}")
 
     params.append(f"use_text_pos={use_text_pos}")
+    params.append(f"service_filter={service_filter}")
 
     message = ", ".join(params)
     logger.debug(f"BLE Scanner started with: {message}")
@@ -160,8 +168,10 @@ if __name__ in ["main", "__main__"]:
 
     # Clear not used notifications from manager
     registered_notifications.filter(args.notification)
+    # Prefer the libuv based event loop when it is available
+    run = uvloop.run if uvloop else asyncio.run
     try:
-        asyncio.run(
+        run(
             main(
                 custom_names=custom_names or settings.ATC_CUSTOM_NAMES,
                 alert_low_threshold=args.alert_low_threshold,
@@ -169,6 +179,7 @@ if __name__ in ["main", "__main__"]:
                 use_text_pos=args.disable_text_pos,
                 sent_threshold_temp=args.sent_threshold_temp,
                 mode=args.mode,
+                service_filter=args.service_filter,
                 notification=registered_notifications,
                 debug=args.debug or settings.DEBUG,
             )
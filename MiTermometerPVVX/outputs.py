@@ -1,6 +1,8 @@
 import asyncio
 from abc import ABC, abstractmethod
+from collections import deque
 import logging
+import sys
 
 from utils import AsyncWithDummy
 
@@ -10,17 +12,12 @@ logger = logging.getLogger(f"BLEScanner.{__name__}")
 class PrintAbstract(ABC):
     """
     Abstract base class for PrintAbstract objects.
-    """
 
-    @property
-    def lock(self) -> asyncio.Lock:
-        """
-        A lock object for use when printing.
+    Attributes:
+        lock (asyncio.Lock): A lock object for use when printing.
+    """
 
-        Returns:
-            asyncio.Lock: An asyncio lock.
-        """
-        return asyncio.Lock()
+    lock: asyncio.Lock
 
     @abstractmethod
     async def print_value(self, text: str, pos: dict = None) -> None:
@@ -33,6 +30,18 @@ class PrintAbstract(ABC):
         """
         ...
 
+    async def print_lines(self, texts: list[str], pos: dict = None) -> None:
+        """
+        Print several lines, one below the other, starting at the position.
+
+        Args:
+            texts (list[str]): The lines to print.
+            pos (dict, optional): The position of the first line. Defaults to None.
+        """
+        for dy, text in enumerate(texts):
+            line_pos = {"x": pos["x"], "y": pos["y"] + dy} if pos else None
+            await self.print_value(text, pos=line_pos)
+
     @abstractmethod
     async def clear(self) -> None:
         """
@@ -67,9 +76,10 @@ class ConsolePrint(PrintAbstract):
 
         Args:
             lock (asyncio.Lock, optional): An asyncio lock for use when printing.
-                Defaults to None.
+                If not provided, a new lock is created. Defaults to None.
         """
         super().__init__()
+        self.lock = lock or asyncio.Lock()
         self.print_method = print
 
     def format_text(self, text: str, pos: dict = None):
@@ -89,6 +99,27 @@ class ConsolePrint(PrintAbstract):
             return self.POSITION.format(y=pos["y"], x=pos["x"], text=text)
         return text
 
+    def format_lines(self, texts: list[str], pos: dict = None):
+        """
+        Format several lines as a single text, optionally positioning each line.
+
+        Args:
+            texts (list[str]): The lines to be formatted.
+            pos (dict, optional): A dictionary containing 'x' and 'y' coordinates
+                                  of the first line. Defaults to None.
+
+        Returns:
+            str: The formatted lines joined by new lines, each line is placed
+                 below the previous one if a position is provided.
+        """
+        if pos is not None:
+            x, y = pos["x"], pos["y"]
+            texts = [
+                self.POSITION.format(y=y + dy, x=x, text=text)
+                for dy, text in enumerate(texts)
+            ]
+        return "\n".join(texts)
+
     async def print_value(self, text: str, pos: dict = None) -> None:
         """
         Print the given text to the console, optionally at a specified position.
@@ -103,6 +134,21 @@ class ConsolePrint(PrintAbstract):
         """
         self.print_method(self.format_text(text, pos))
 
+    async def print_lines(self, texts: list[str], pos: dict = None) -> None:
+        """
+        Print several lines to the console with a single print call.
+
+        Args:
+            texts (list[str]): The lines to be printed.
+            pos (dict, optional): A dictionary containing 'x' and 'y' coordinates
+                                  of the first line. Defaults to None.
+
+        Returns:
+            None
+        """
+        if texts:
+            self.print_method(self.format_lines(texts, pos))
+
     async def clear(self):
         """
         Clear the terminal screen by printing the clear screen escape sequence.
@@ -116,9 +162,9 @@ class ConsolePrint(PrintAbstract):
         """
         Clear the specified number of lines on the console.
 
-        This method uses the print method specified in the class to execute
-        the terminal command that clears a single line, and repeats this for
-        the specified number of lines.
+        This method joins the terminal command that clears a single line
+        for the specified number of lines and prints them with a single call
+        of the print method specified in the class.
 
         Args:
             lines (int, optional): The number of lines to clear. Defaults to 1.
@@ -126,8 +172,8 @@ class ConsolePrint(PrintAbstract):
         Returns:
             None
         """
-        for _ in range(lines):
-            self.print_method(self.CLEAR_LINE)
+        if lines > 0:
+            self.print_method("\n".join([self.CLEAR_LINE] * lines))
 
 
 class ConsolePrintAsync(ConsolePrint):
@@ -135,55 +181,64 @@ class ConsolePrintAsync(ConsolePrint):
         """
         Initialize the asynchronous print class.
 
-        This class is a wrapper around ConsolePrint, and uses an asyncio
-        Queue to handle the actual printing of messages. A worker task is
-        created to consume the queue and print the messages. The print
-        method is replaced with an asynchronous version that adds the
-        message to the queue.
+        This class is a wrapper around ConsolePrint, and uses a deque
+        together with an asyncio Event to handle the actual printing of
+        messages. A worker task is created to consume the queue and print
+        the messages. The print method is replaced with an asynchronous
+        version that adds the message to the queue and notifies the worker.
 
         Args:
             lock (asyncio.Lock): The lock to use when accessing the print
-                queue. If not provided, a dummy lock is used.
+                queue. If not provided, a new lock is created.
         """
-        super().__init__()
-        self.print_queue = asyncio.Queue()
+        super().__init__(lock)
+        self.print_queue = deque()
+        self.print_notify = asyncio.Event()
         self.worker_task = asyncio.create_task(self.print_worker())
         self.print_method = self.async_print
-        self._lock = lock
-
-    @property
-    def lock(self) -> asyncio.Lock:
-        return self._lock or asyncio.Lock()
 
     async def print_worker(self):
         """
         Print worker task that consumes the print queue.
 
-        This task waits for messages to be put into the print queue and
-        prints them to the console. If the message is None, the task
-        assumes that this is an exit signal and breaks out of the loop.
-
-        The task is responsible for calling task_done() on the queue after
-        printing each message, to allow the queue to be properly drained.
-        """
-        while True:
-            message = await self.print_queue.get()
-            if message is None:  # Exit signal
-                break
-            print(message)  # Perform the actual print operation
-            self.print_queue.task_done()
+        This task waits until it is notified about new messages, then drains
+        every message in the print queue and prints them to the console with
+        a single write. If a message is None, the task assumes that this is
+        an exit signal and breaks out of the loop after printing the messages
+        queued before it.
+        """
+        # Bind the methods used in the loop once
+        queue, popleft = self.print_queue, self.print_queue.popleft
+        wait, clear = self.print_notify.wait, self.print_notify.clear
+        write, flush = sys.stdout.write, sys.stdout.flush
+        running = True
+        while running:
+            await wait()
+            clear()
+            batch = []
+            while queue:
+                message = popleft()
+                if message is None:  # Exit signal
+                    running = False
+                    break
+                batch.append(message)
+            if batch:
+                # Perform the actual print operation
+                write("\n".join(batch) + "\n")
+                flush()
 
     async def async_print(self, text: str):
         """
         Asynchronous print function that adds a string to the print queue.
 
         The string is added to the print queue and the print worker task
-        will print it when it is consumed from the queue.
+        is notified to print it.
 
         Args:
             text (str): The string to print
         """
-        await self.print_queue.put(text)
+        self.print_queue.append(text)
+        self.print_notify.set()
 
     async def print_value(self, text: str, pos: dict = None) -> None:
         """
@@ -200,6 +255,21 @@ class ConsolePrintAsync(ConsolePrint):
         """
         await self.print_method(self.format_text(text, pos))
 
+    async def print_lines(self, texts: list[str], pos: dict = None) -> None:
+        """
+        Asynchronous print function that adds several lines to the print queue.
+
+        The lines are formatted with any specified position information and
+        added to the print queue as a single message.
+
+        Args:
+            texts (list[str]): The lines to print
+            pos (dict, optional): A dictionary containing 'x' and 'y' coordinates
+                                  of the first line. Defaults to None.
+        """
+        if texts:
+            await self.print_method(self.format_lines(texts, pos))
+
     async def clear(self):
         """
         Clear the terminal screen asynchronously.
@@ -217,9 +287,9 @@ class ConsolePrintAsync(ConsolePrint):
         """
         Clear the specified number of lines on the console asynchronously.
 
-        This method adds clear line escape sequences to the print queue
-        for the specified number of lines. The print worker task will print
-        them when they are consumed from the queue.
+        This method adds clear line escape sequences for the specified
+        number of lines to the print queue as a single message. The print
+        worker task will print it when it is consumed from the queue.
 
         Args:
             lines (int, optional): The number of lines to clear. Defaults to 1.
@@ -227,8 +297,8 @@ class ConsolePrintAsync(ConsolePrint):
         Returns:
             None
         """
-        for _ in range(lines):
-            await self.print_method(self.CLEAR_LINE)
+        if lines > 0:
+            await self.print_method("\n".join([self.CLEAR_LINE] * lines))
 
     async def close(self):
         """
@@ -242,5 +312,5 @@ class ConsolePrintAsync(ConsolePrint):
         Returns:
             None
         """
-        await self.print_queue.put(None)  # Send exit signal to worker
+        await self.async_print(None)  # Send exit signal to worker
         await self.worker_task
@@ -56,6 +56,13 @@ def parse_args(notification_names=None):
         default=settings.BLE_SCANNER_MODE,
         help=f"Select scan mode. Default is '{settings.BLE_SCANNER_MODE}'.",
     )
+    parser.add_argument(
+        "-sf",
+        "--service_filter",
+        default=settings.BLE_SERVICE_FILTER,
+        help=f"Filter ATC advertisements by service UUID in the platform BLE scanner. Default is {'enabled' if settings.BLE_SERVICE_FILTER else 'disabled'}.",
+        action="store_true",
+    )
     notification_registered_choice = notification_names or []
     notification_registered_choice.append("none")
     notification_registered_default = (
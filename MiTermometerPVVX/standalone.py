@@ -1,33 +1,97 @@
 import asyncio
 import datetime
+import os
+import shutil
+import struct
+import sys
+import time
 
-# import os
-
-# import struct
 from bleak import BleakScanner, BleakError
 
 # MiTermometerPVVX
 
+ATC_SERVICE = sys.intern("0000181a-0000-1000-8000-00805f9b34fb")
+# temp, humidity, battery_v, battery, count at offset 6 of the ATC payload
+ATC_STRUCT = struct.Struct("<hhHBB")
+ATC_PAYLOAD_SIZE = 6 + ATC_STRUCT.size
+# Seconds between redraws of the collected advertisements
+RENDER_INTERVAL = 0.2
+# (label, label width) of every device block line, None is the separator line
+LINES = (
+    ("device:", 10),
+    (None, 0),
+    ("temp:", 10),
+    ("humidity:", 10),
+    ("batteryv:", 10),
+    ("battery:", 10),
+    ("rssi:", 9),
+    ("count:", 10),
+    ("time now:", 10),
+    ("Duration:", 10),
+)
+# Width and height of a device block cell on the screen
+TEXT_WIDTH = 32
+TEXT_HEIGHT = 10 + 3
+# Longest shown device name, it leaves a free column before the next cell
+NAME_WIDTH = TEXT_WIDTH - 1 - 10
+MAX_SLOTS = 64
+# (x, y) of every device block cell, filled by init_slots()
+SLOT_POS: list[tuple[int, int]] = []
+# Default device names by address
+DEFAULT_NAMES: dict[str, str] = {}
+
+
+def default_name(address: str) -> str:
+    """Get the default device name made of the address tail."""
+    name = DEFAULT_NAMES.get(address)
+    if name is None:
+        if ":" in address:
+            # AA:BB:CC:DD:EE:FF
+            uiid = address[9:11] + address[12:14] + address[15:17]
+        else:
+            uiid = address[-6:]
+        name = DEFAULT_NAMES[address] = "ATC_" + uiid
+    return name
+
+
+def init_slots(max_slots: int = MAX_SLOTS) -> None:
+    """Compute the device block cell positions for the terminal width."""
+    cols = max(1, shutil.get_terminal_size().columns // TEXT_WIDTH)
+    SLOT_POS[:] = [
+        (TEXT_WIDTH * (i % cols), TEXT_HEIGHT * (i // cols) + 1)
+        for i in range(max_slots)
+    ]
+
+
+def _layout(id: int, name: str) -> tuple:
+    """Build the positioned label prefix and value width of every block line."""
+    name_len = 10 + min(len(name), NAME_WIDTH)
+    # Devices beyond the table reuse the cells from the beginning
+    pos_x, pos_y = SLOT_POS[id % len(SLOT_POS)]
+    prefixes = []
+    for dy, (label, width) in enumerate(LINES):
+        position = f"\033[{pos_y + dy};{pos_x}H"
+        if label is None:
+            prefixes.append((f"{position}{'-' * max(18, name_len)}", 0))
+        elif dy == 0:
+            prefixes.append((f"{position}{label:<{width}}", 0))
+        else:
+            prefixes.append((f"{position}{label:<{width}}", 20 - width))
+    return tuple(prefixes)
+
 
 async def main():
-    ATC_SERVICE = "0000181a-0000-1000-8000-00805f9b34fb"
+    init_slots()
     stop_event = asyncio.Event()
     atc_counters = {}
     atc_date = {}
     atc_custom_name = {"DB77": "SLEEP ROOM", "995B": "MAIN ROOM"}
     atc_devices = {}
-    print_pos = {"x": 0, "y": 0}
-
-    def print_text_pos(x: int, y: int) -> None:
-        print_pos["x"] = x
-        print_pos["y"] = y
-
-    def print_text(text: str) -> None:
-        print("\033[" + str(print_pos["y"]) + ";" + str(print_pos["x"]) + "H" + text)
-        print_pos["y"] += 1
+    queue = asyncio.Queue()
 
     def print_clear() -> None:
-        print("\033c\033[3J")
+        sys.stdout.write("\033c\033[3J")
+        sys.stdout.flush()
 
     def custom_name(name: str) -> str:
         for template, custom_name in atc_custom_name.items():
@@ -37,107 +101,118 @@ async def main():
 
     def callback(device, advertising_data):
         adv_atc = advertising_data.service_data.get(ATC_SERVICE)
-        if not adv_atc:
+        # Skip other formats of the same service, e.g. ATC1441 or encrypted ones
+        if not adv_atc or len(adv_atc) < ATC_PAYLOAD_SIZE:
+            return
+        # BLE repeats the same advertisement on every channel, skip the duplicates
+        if atc_counters.get(device.address) == adv_atc[13]:
             return
+        queue.put_nowait(
+            (
+                device.address,
+                device.name,
+                bytes(adv_atc),
+                advertising_data.rssi,
+                time.monotonic(),
+            )
+        )
+
+    def device_name(address: str, name: str) -> str:
+        if name:
+            name = custom_name(name)
+            stored_dev = atc_devices.get(address)
+            if stored_dev and name != stored_dev["name"]:
+                stored_dev["name"] = name
+                stored_dev["prefixes"] = _layout(stored_dev["id"], name)
+
+        if address not in atc_devices:
+            if len(atc_devices) == 0:
+                print_clear()
+            atc_devices[address] = {"name": name, "id": len(atc_devices)}
+
+        if not name:
+            name = atc_devices[address]["name"]
+            if not name:
+                name = custom_name(default_name(address))
+                atc_devices[address]["name"] = name
 
-        # if device.address not in atc_devices:
-        #     return
-        # print(f"advertising_data:\t  {advertising_data.local_name}", atc_devices)
-        if advertising_data:
-            name = device.name
-            if name:
-                name = custom_name(name)
-                stored_dev = atc_devices.get(device.address)
-                if stored_dev and name != stored_dev["name"]:
-                    stored_dev["name"] = name
-
-            if device.address not in atc_devices:
-                if len(atc_devices) == 0:
-                    print_clear()
-                atc_devices[device.address] = {"name": name, "id": len(atc_devices)}
-                # print(atc_devices)
+        if "prefixes" not in atc_devices[address]:
+            atc_devices[address]["prefixes"] = _layout(atc_devices[address]["id"], name)
+        return name
 
-            if not name:
-                name = atc_devices.get(device.address)["name"]
-                if not name:
-                    if ":" in device.address:
-                        uiid = "".join(device.address.split(":")[-3:])
-                    else:
-                        uiid = device.address.split("-")[-1][-6:]
-                    name = "ATC_" + uiid
-                    name = custom_name(name)
-                    atc_devices[device.address]["name"] = name
-
-        # print(atc_devices)
-        # if name and name[0:3] == "ATC":
-        if True:
-            rssi = advertising_data.rssi
-            # adv_atc = advertising_data.service_data[ATC_SERVICE]
-            if adv_atc:
-                count = int.from_bytes(adv_atc[13:14], byteorder="little", signed=False)
-                # (temp,humidity,battery_v,battery,count) = struct.unpack('<hhHBB',adv_atc[6:14])
-                if atc_counters.get(device.address) != count:
-                    atc_counters.update({device.address: count})
-                    date_now = datetime.datetime.now()
-                    date_prev = atc_date.get(device.address)
-                    if date_prev:
-                        date_diff = date_now - date_prev
-                        date_diff = datetime.timedelta(
-                            seconds=round(date_diff.total_seconds())
-                        )
-                    else:
-                        date_diff = 0
-                    atc_date.update({device.address: date_now})
-                    temp = int.from_bytes(adv_atc[6:8], byteorder="little", signed=True)
-                    humidity = int.from_bytes(
-                        adv_atc[8:10], byteorder="little", signed=True
-                    )
-                    battery_v = int.from_bytes(
-                        adv_atc[10:12], byteorder="little", signed=False
-                    )
-                    battery = int.from_bytes(
-                        adv_atc[12:13], byteorder="little", signed=False
-                    )
-                    # flag=int.from_bytes(adv_atc[14:15], byteorder='little', signed=False)
-                    temp = temp / 100.0
-                    humidity = humidity / 100.0
-                    battery_v = battery_v / 1000.0
-
-                    # print(atc_devices[device.address])
-                    id = atc_devices[device.address]["id"]
-                    h1 = 10
-                    h2 = 10
-                    gap = 12
-                    name_len = h1 + len(name)
-                    text_width = name_len + gap
-                    text_hight = 10 + 3
-                    cols = 4
-                    pos_x = text_width * (id % cols)
-                    pos_y = text_hight * (id // cols) + 1
-                    print_text_pos(pos_x, pos_y)
-                    # print_text(f"{'device:':<{h1}}{name}")
-                    print_text("{:<10}{}".format("device:", name))
-                    print_text("-" * max(18, name_len))
-                    print_text("{:<10}{:<10}".format("temp:", f"{temp:.2f} \xB0C"))
-                    print_text("{:<10}{:<10}".format("humidity:", f"{humidity:.2f} %"))
-                    print_text("{:<10}{:<10}".format("batteryv:", f"{battery_v} V"))
-                    print_text("{:<10}{:<10}".format("battery:", f"{battery} %"))
-                    print_text("{:<9}{:<11}".format("rssi:", f"{rssi} dBm"))
-                    print_text("{:<10}{:<10}".format("count:", f"{count}"))
-                    print_text(
-                        "{:<10}{:<10}".format(
-                            "time now:", f"{date_now.strftime('%H:%M:%S')}"
-                        )
-                    )
-                    if date_diff:
-                        print_text(
-                            "{:<10}{:<10}".format("Duration:", f"{str(date_diff)}")
-                        )
-                    # print_text_pos(0, 14)
-                    # print_text("debug:")
-                    # print(device.name, advertising_data.local_name, atc_devices)
-                    # print_text(' '.join('{}:{:02x}'.format(i,x) for i,x in enumerate(adv_atc)))
+    def render_block(
+        address: str, name: str, adv_atc: bytes, rssi: int, now_mono: float
+    ) -> str | None:
+        temp, humidity, battery_v, battery, count = ATC_STRUCT.unpack_from(adv_atc, 6)
+        if atc_counters.get(address) == count:
+            return None
+        name = device_name(address, name)
+        date_prev = atc_date.get(address)
+        if date_prev:
+            date_diff = datetime.timedelta(seconds=round(now_mono - date_prev))
+        else:
+            date_diff = 0
+        temp = temp / 100.0
+        humidity = humidity / 100.0
+        battery_v = battery_v / 1000.0
+
+        values = [
+            name[:NAME_WIDTH],
+            "",
+            f"{temp:.2f} \xb0C",
+            f"{humidity:.2f} %",
+            f"{battery_v} V",
+            f"{battery} %",
+            f"{rssi} dBm",
+            f"{count}",
+            time.strftime("%H:%M:%S"),
+        ]
+        if date_diff:
+            values.append(str(date_diff))
+        prefixes = atc_devices[address]["prefixes"]
+        block = "".join(
+            f"{prefix}{value:<{width}}\n"
+            for (prefix, width), value in zip(prefixes, values)
+        )
+        # Mark the measurement as drawn only once its block is built
+        atc_counters[address] = count
+        atc_date[address] = now_mono
+        return block
+
+    def render_item(item: tuple) -> str | None:
+        try:
+            return render_block(*item)
+        except Exception as e:
+            # Keep the blocks of the other devices in the batch
+            print("error", e)
+            return None
+
+    def write_text(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    async def renderer():
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(RENDER_INTERVAL)
+            # Keep only the newest advertisement of every device
+            latest = {}
+            while not queue.empty():
+                item = queue.get_nowait()
+                latest[item[0]] = item
+            if not latest:
+                continue
+            try:
+                blocks = [render_item(item) for item in latest.values()]
+                text = "".join(block for block in blocks if block)
+                if text:
+                    # Only the write leaves the event loop, the device state stays on it
+                    await loop.run_in_executor(None, write_text, text)
+            except Exception as e:
+                # Keep drawing the next updates after a failed batch
+                print("error", e)
 
+    render_task = asyncio.create_task(renderer())
     try:
         # mode = "passive"
         # mode = "active"
@@ -158,9 +233,18 @@ async def main():
     except asyncio.CancelledError:
         print("**** task scanner cancelled")
         stop_event.set()
+    finally:
+        render_task.cancel()
+        try:
+            await render_task
+        except asyncio.CancelledError:
+            pass
 
 
 if __name__ == "__main__":
+    if os.name == "nt":
+        # Enable VT escape sequences processing once in the Windows console
+        os.system("")
     try:
         asyncio.run(main())
     except Exception as e: